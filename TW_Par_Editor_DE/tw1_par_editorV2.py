@@ -140,41 +140,6 @@ class ParReader:
         return p
 
 
-def decompress_par_file(raw_data):
-    """Decompress a PAR file from disk. Handles zlib-compressed wrapper format.
-    Returns (par_data, wrapper_header) where wrapper_header is None if not compressed."""
-    if raw_data[:2] == b'\x78\x9c' or raw_data[:2] == b'\x78\x01' or raw_data[:2] == b'\x78\xda':
-        # zlib compressed — Two Worlds uses dual-stream format:
-        #   Stream 1: small wrapper header (translateGameParams + GUID)
-        #   Stream 2: actual PAR binary data
-        dec1 = zlib.decompressobj()
-        wrapper = dec1.decompress(raw_data)
-        remaining = dec1.unused_data
-
-        if remaining and (remaining[:1] == b'\x78'):
-            dec2 = zlib.decompressobj()
-            par_data = dec2.decompress(remaining)
-            return par_data, wrapper, True
-        else:
-            # Single stream — the decompressed data IS the PAR
-            return wrapper, None, True
-    elif raw_data[:4] == PAR_MAGIC:
-        return raw_data, None, False
-    else:
-        raise ValueError(f"Unknown file format (header: {raw_data[:4].hex()})")
-
-
-def compress_par_file(par_data, wrapper_header=None):
-    """Compress PAR data back to the on-disk format with zlib wrapper."""
-    if wrapper_header is not None:
-        stream1 = zlib.compress(wrapper_header, 6)
-        stream2 = zlib.compress(par_data, 6)
-        return stream1 + stream2
-    else:
-        return zlib.compress(par_data, 6)
-
-
-
 def read_par(data):
     """Parse a PAR binary file. Returns ParFile."""
     r = ParReader(data)
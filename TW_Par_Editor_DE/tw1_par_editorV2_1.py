@@ -3,21 +3,53 @@
    Now with SDK field labels, duplicate/delete/rename entries"""
 
 import struct
+import array
+import base64
+import mmap
 import os
 import sys
 import json
 import io
 import zlib
 import copy
+import hashlib
+import functools
+import math
 from pathlib import Path
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# tkinter is imported on first GUI use (see _import_tk), so the --info and
+# --export commands start without loading Tk.
+tk = ttk = filedialog = messagebox = simpledialog = None
+HAS_TK = None   # Unknown until _import_tk() has run
+
+
+def _import_tk():
+    """Import tkinter into the module globals. Returns HAS_TK."""
+    global tk, ttk, filedialog, messagebox, simpledialog, HAS_TK
+    if HAS_TK is None:
+        try:
+            import tkinter as tk
+            from tkinter import ttk, filedialog, messagebox, simpledialog
+            HAS_TK = True
+        except ImportError:
+            HAS_TK = False
+    return HAS_TK
+
+try:
+    # Optional drop-in replacement for zlib backed by Intel ISA-L (pip install isal)
+    from isal import isal_zlib as _zlib
+    HAS_ISAL = True
+except ImportError:
+    _zlib = zlib
+    HAS_ISAL = False
 
 try:
-    import tkinter as tk
-    from tkinter import ttk, filedialog, messagebox, simpledialog
-    HAS_TK = True
+    # Optional fast JSON library for export_json and label files (pip install orjson)
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_TK = False
+    HAS_ORJSON = False
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # PAR FORMAT CONSTANTS
@@ -53,32 +85,80 @@ TYPE_NAMES = {
 
 class ParFile:
     """Represents a complete PAR file."""
+    __slots__ = ('version', 'lists', 'filepath', 'wrapper_header',
+                 'was_compressed', 'compressed_cache', 'trailing_data')
+
     def __init__(self):
         self.version = PAR_VERSION_TW1
         self.lists = []       # [ParList, ...]
         self.filepath = ""
         self.wrapper_header = None   # zlib wrapper header (stream 1)
         self.was_compressed = False   # file was zlib-compressed on disk
+        self.compressed_cache = None  # (digest, on-disk bytes) of last load/save
         self.trailing_data = None     # bytes after parsed content
 
 class ParList:
     """A list within the PAR file."""
+    __slots__ = ('unknown1', 'unknown2', 'entries')
+
     def __init__(self):
         self.unknown1 = 0
         self.unknown2 = 0
         self.entries = []     # [ParEntry, ...]
 
 class ParEntry:
-    """A single named entry with typed data fields."""
+    """A single named entry with typed data fields.
+
+    Entries from read_par(lazy=True) keep their field bytes undecoded until
+    .fields is first accessed; write_par copies such entries through as-is."""
+    __slots__ = ('name', 'unknown_byte', 'unknown_u16a', 'unknown_u16b',
+                 '_fields', '_raw')
+
     def __init__(self):
         self.name = ""
         self.unknown_byte = 0
         self.unknown_u16a = 0
         self.unknown_u16b = 0
-        self.fields = []      # [ParField, ...]
+        self._fields = []     # [ParField, ...]
+        self._raw = None      # (data, type_list_pos, field_count, end) while undecoded
+
+    @property
+    def fields(self):
+        if self._raw is not None:
+            self._fields = _decode_fields(self._raw)
+            self._raw = None
+        return self._fields
+
+    @fields.setter
+    def fields(self, value):
+        self._fields = value
+        self._raw = None
+
+    @property
+    def field_count(self):
+        """Number of fields, without decoding a lazy entry."""
+        if self._raw is not None:
+            return self._raw[2]
+        return len(self._fields)
+
+    @property
+    def dtypes(self):
+        """Field type IDs as bytes, without decoding a lazy entry."""
+        if self._raw is not None:
+            data, type_pos, field_count, _end = self._raw
+            return bytes(data[type_pos:type_pos + field_count])
+        return bytes(f.dtype for f in self._fields)
+
+    def head_fields(self, n):
+        """First n fields. A lazy entry decodes only those, and stays lazy."""
+        if self._raw is not None:
+            return _decode_fields(self._raw, n)
+        return self._fields[:n]
 
 class ParField:
     """A single typed data field within an entry."""
+    __slots__ = ('dtype', 'value')
+
     def __init__(self, dtype=0, value=None):
         self.dtype = dtype    # Type ID (0-7)
         self.value = value    # Python value (int, float, str, list)
@@ -87,6 +167,25 @@ class ParField:
 # PAR BINARY READER
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Precompiled little-endian primitives (struct.Struct parses the format once).
+# Reading past the end raises struct.error from unpack_from.
+_U16 = struct.Struct('<H').unpack_from
+_U32 = struct.Struct('<I').unpack_from
+_I32 = struct.Struct('<i').unpack_from
+_F32 = struct.Struct('<f').unpack_from
+_U64 = struct.Struct('<Q').unpack_from
+
+# Multi-value records decoded with a single unpack_from
+_LIST_HEADER  = struct.Struct('<III')    # unknown1, unknown2, entry count
+_ENTRY_HEADER = struct.Struct('<bHHH')   # unknown byte, field count, u16a, u16b
+
+# Numeric arrays are decoded in bulk with array.array (native order, 4-byte items)
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+# Strings up to this many bytes are interned by read_delphi_string
+_INTERN_MAX = 64
+_intern = sys.intern
+
 class ParReader:
     """Reads PAR binary format."""
 
@@ -103,25 +202,46 @@ class ParReader:
         return result
 
     def read_u8(self):
-        return struct.unpack_from('<B', self.data, self._advance(1))[0]
+        # Indexing bytes already yields an int, no struct round-trip needed
+        v = self.data[self.pos]
+        self.pos += 1
+        return v
 
     def read_i8(self):
-        return struct.unpack_from('<b', self.data, self._advance(1))[0]
+        v = self.data[self.pos]
+        self.pos += 1
+        return v - 256 if v > 127 else v
 
     def read_u16(self):
-        return struct.unpack_from('<H', self.data, self._advance(2))[0]
+        v, = _U16(self.data, self.pos)
+        self.pos += 2
+        return v
 
     def read_u32(self):
-        return struct.unpack_from('<I', self.data, self._advance(4))[0]
+        v, = _U32(self.data, self.pos)
+        self.pos += 4
+        return v
 
     def read_i32(self):
-        return struct.unpack_from('<i', self.data, self._advance(4))[0]
+        v, = _I32(self.data, self.pos)
+        self.pos += 4
+        return v
 
     def read_f32(self):
-        return struct.unpack_from('<f', self.data, self._advance(4))[0]
+        v, = _F32(self.data, self.pos)
+        self.pos += 4
+        return v
 
     def read_u64(self):
-        return struct.unpack_from('<Q', self.data, self._advance(8))[0]
+        v, = _U64(self.data, self.pos)
+        self.pos += 8
+        return v
+
+    def read_struct(self, st):
+        """Unpack a precompiled struct.Struct record at the current position."""
+        values = st.unpack_from(self.data, self.pos)
+        self.pos += st.size
+        return values
 
     def read_delphi_string(self):
         length = self.read_u32()
@@ -130,20 +250,30 @@ class ParReader:
         if length == 0:
             return ""
         raw = self.read_bytes(length)
-        return raw.decode('ascii', errors='replace')
+        try:
+            s = raw.decode('ascii')   # fast path: PAR strings are plain ASCII
+        except UnicodeDecodeError:
+            return raw.decode('ascii', errors='replace')
+        # Short strings (class IDs, mesh/sound names) repeat across entries;
+        # share one copy of each instead of one per occurrence.
+        if length <= _INTERN_MAX:
+            return _intern(s)
+        return s
 
-    def _advance(self, n):
-        if self.pos + n > self.size:
-            raise ValueError(f"Read past end at offset 0x{self.pos:X}")
-        p = self.pos
-        self.pos += n
-        return p
 
 
+def read_par(data, lazy=False):
+    """Parse a PAR binary file. Returns ParFile.
 
-def read_par(data):
-    """Parse a PAR binary file. Returns ParFile."""
+    With lazy=True only names and headers are decoded up front; each entry's
+    fields are validated and skipped, then decoded on first access.
+    """
+    if lazy and not isinstance(data, bytes):
+        data = bytes(data)    # lazy entries keep a reference to the buffer
     r = ParReader(data)
+    read_value = _field_readers(r)
+    read_plans = _READ_PLANS
+    read_struct = r.read_struct
 
     # Header
     magic = r.read_bytes(4)
@@ -159,50 +289,36 @@ def read_par(data):
 
     for li in range(list_count):
         pl = ParList()
-        pl.unknown1 = r.read_u32()
-        pl.unknown2 = r.read_u32()
-
-        # Prefixed Array<List Entry>
-        entry_count = r.read_u32()
+        # unknown1, unknown2, then Prefixed Array<List Entry> count
+        pl.unknown1, pl.unknown2, entry_count = r.read_struct(_LIST_HEADER)
 
         for ei in range(entry_count):
             entry = ParEntry()
             entry.name = r.read_delphi_string()
-            entry.unknown_byte = r.read_i8()
+            (entry.unknown_byte, data_entry_count,
+             entry.unknown_u16a, entry.unknown_u16b) = r.read_struct(_ENTRY_HEADER)
 
-            data_entry_count = r.read_u16()
-            entry.unknown_u16a = r.read_u16()
-            entry.unknown_u16b = r.read_u16()
+            # Data Type List (one byte per field; iterating bytes yields ints)
+            type_pos = r.pos
+            type_list = r.read_bytes(data_entry_count)
 
-            # Data Type List
-            type_list = []
-            for _ in range(data_entry_count):
-                type_list.append(r.read_u8())
+            if lazy:
+                _skip_fields(r, _SKIP_PLANS.get(type_list) or _skip_plan(type_list))
+                entry._raw = (data, type_pos, data_entry_count, r.pos)
+                pl.entries.append(entry)
+                continue
 
             # Data Entry List
-            for dtype in type_list:
-                field = ParField(dtype)
-
-                if dtype == TYPE_INT32:
-                    field.value = r.read_i32()
-                elif dtype == TYPE_FLOAT32:
-                    field.value = r.read_f32()
-                elif dtype == TYPE_UINT32:
-                    field.value = r.read_u32()
-                elif dtype == TYPE_STRING:
-                    field.value = r.read_delphi_string()
-                elif dtype == TYPE_ARRAY_INT32:
-                    field.value = _read_extra_array(r, 'i')
-                elif dtype == TYPE_ARRAY_FLOAT:
-                    field.value = _read_extra_array(r, 'f')
-                elif dtype == TYPE_ARRAY_UINT32:
-                    field.value = _read_extra_array(r, 'I')
-                elif dtype == TYPE_ARRAY_STR:
-                    field.value = _read_extra_string_array(r)
+            plan = read_plans.get(type_list)
+            if plan is None:
+                plan = _read_plan(type_list, type_pos)
+            # Same loop as _read_fields, inlined: this runs once per entry
+            fields = entry._fields
+            for step in plan:
+                if step.__class__ is int:
+                    fields.append(ParField(step, read_value[step]()))
                 else:
-                    raise ValueError(f"Unknown data type {dtype} at 0x{r.pos:X}")
-
-                entry.fields.append(field)
+                    fields.extend(map(ParField, step[1], read_struct(step[0])))
 
             pl.entries.append(entry)
         par.lists.append(pl)
@@ -220,15 +336,11 @@ def _read_extra_array(reader, fmt_char):
     if check == 0:
         return []
     length = reader.read_u32()
-    values = []
-    for _ in range(length):
-        if fmt_char == 'i':
-            values.append(reader.read_i32())
-        elif fmt_char == 'f':
-            values.append(reader.read_f32())
-        elif fmt_char == 'I':
-            values.append(reader.read_u32())
-    return values
+    arr = array.array(fmt_char)
+    arr.frombytes(reader.read_bytes(length * 4))
+    if _BIG_ENDIAN:
+        arr.byteswap()
+    return arr.tolist()
 
 
 def _read_extra_string_array(reader):
@@ -243,44 +355,189 @@ def _read_extra_string_array(reader):
     return values
 
 
+def _field_readers(r):
+    """Jump table dtype -> zero-arg callable reading one field value from r."""
+    return {
+        TYPE_INT32:        r.read_i32,
+        TYPE_FLOAT32:      r.read_f32,
+        TYPE_UINT32:       r.read_u32,
+        TYPE_STRING:       r.read_delphi_string,
+        TYPE_ARRAY_INT32:  lambda: _read_extra_array(r, 'i'),
+        TYPE_ARRAY_FLOAT:  lambda: _read_extra_array(r, 'f'),
+        TYPE_ARRAY_UINT32: lambda: _read_extra_array(r, 'I'),
+        TYPE_ARRAY_STR:    lambda: _read_extra_string_array(r),
+    }
+
+
+def _decode_fields(raw, limit=None):
+    """Decode the fields of a lazily parsed entry (see ParEntry._raw)."""
+    data, type_pos, field_count, _end = raw
+    r = ParReader(data)
+    r.pos = type_pos + field_count
+    type_list = data[type_pos:type_pos + field_count]
+    if limit is not None:
+        type_list = type_list[:limit]
+    plan = _READ_PLANS.get(type_list) or _read_plan(type_list, type_pos)
+    return _read_fields(r, plan, _field_readers(r))
+
+
+# type list bytes -> (dtype or (Struct, dtypes of a scalar run), ...)
+_READ_PLANS = {}
+
+_SCALAR_CODES = {TYPE_INT32: 'i', TYPE_FLOAT32: 'f', TYPE_UINT32: 'I'}
+
+
+def _read_plan(type_list, type_pos=0):
+    """Build (and cache) the read plan for one field layout.
+
+    Entries with the same field count share a layout, so each run of
+    consecutive scalar fields is decoded with one precompiled Struct;
+    strings and arrays remain single steps through the field readers.
+    """
+    steps = []
+    codes = ''
+    run = []
+    for i, dtype in enumerate(type_list):
+        code = _SCALAR_CODES.get(dtype)
+        if code is not None:
+            codes += code
+            run.append(dtype)
+            continue
+        if not TYPE_STRING <= dtype <= TYPE_ARRAY_STR:
+            raise ValueError(f"Unknown data type {dtype} at 0x{type_pos + i:X}")
+        _add_scalar_run(steps, codes, run)
+        codes = ''
+        run = []
+        steps.append(dtype)
+    _add_scalar_run(steps, codes, run)
+    plan = tuple(steps)
+    _READ_PLANS[bytes(type_list)] = plan
+    return plan
+
+
+def _add_scalar_run(steps, codes, run):
+    # A lone scalar is cheaper through its plain reader than as a 1-tuple
+    if len(run) == 1:
+        steps.append(run[0])
+    elif run:
+        steps.append((struct.Struct('<' + codes), tuple(run)))
+
+
+def _read_fields(r, plan, read_value):
+    """Decode one entry's fields from r following a _read_plan."""
+    fields = []
+    for step in plan:
+        if step.__class__ is int:
+            fields.append(ParField(step, read_value[step]()))
+        else:
+            fields.extend(map(ParField, step[1], r.read_struct(step[0])))
+    return fields
+
+
+# type list bytes -> ((fixed bytes before, variable dtype), ...), trailing fixed bytes)
+_SKIP_PLANS = {}
+
+
+def _skip_plan(type_list):
+    """Build (and cache) the skip plan for one field layout."""
+    steps = []
+    gap = 0
+    for dtype in type_list:
+        if dtype in (TYPE_INT32, TYPE_FLOAT32, TYPE_UINT32):
+            gap += 4
+        elif TYPE_STRING <= dtype <= TYPE_ARRAY_STR:
+            steps.append((gap, dtype))
+            gap = 0
+        else:
+            raise ValueError(f"Unknown data type {dtype}")
+    plan = (tuple(steps), gap)
+    _SKIP_PLANS[bytes(type_list)] = plan
+    return plan
+
+
+def _skip_fields(r, plan):
+    """Advance r past one entry's field data, checking lengths and bounds."""
+    data = r.data
+    pos = r.pos
+    steps, tail = plan
+    for gap, dtype in steps:
+        pos += gap
+        if dtype == TYPE_STRING:
+            length, = _U32(data, pos)
+            if length > 1000000:
+                raise ValueError(f"Unreasonable string length {length} at 0x{pos + 4:X}")
+            pos += 4 + length
+            continue
+        check, = _U64(data, pos)
+        pos += 8
+        if check == 0:
+            continue
+        count, = _U32(data, pos)
+        pos += 4
+        if dtype != TYPE_ARRAY_STR:
+            pos += 4 * count
+            continue
+        for _ in range(count):
+            length, = _U32(data, pos)
+            if length > 1000000:
+                raise ValueError(f"Unreasonable string length {length} at 0x{pos + 4:X}")
+            pos += 4 + length
+    pos += tail
+    if pos > r.size:
+        raise ValueError(f"Read past end at offset 0x{r.pos:X}, need {pos - r.pos} bytes")
+    r.pos = pos
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # PAR BINARY WRITER
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_PACK_U8  = struct.Struct('<B').pack
+_PACK_I8  = struct.Struct('<b').pack
+_PACK_U16 = struct.Struct('<H').pack
+_PACK_U32 = struct.Struct('<I').pack
+_PACK_I32 = struct.Struct('<i').pack
+_PACK_F32 = struct.Struct('<f').pack
+_PACK_U64 = struct.Struct('<Q').pack
+
 class ParWriter:
     """Writes PAR binary format."""
 
     def __init__(self):
         self.buf = io.BytesIO()
+        self._put = self.buf.write   # bound once; BytesIO beats list+join here
 
     def write_bytes(self, b):
-        self.buf.write(b)
+        self._put(b)
 
     def write_u8(self, v):
-        self.buf.write(struct.pack('<B', v & 0xFF))
+        self._put(_PACK_U8(v & 0xFF))
 
     def write_i8(self, v):
-        self.buf.write(struct.pack('<b', v))
+        self._put(_PACK_I8(v))
 
     def write_u16(self, v):
-        self.buf.write(struct.pack('<H', v & 0xFFFF))
+        self._put(_PACK_U16(v & 0xFFFF))
 
     def write_u32(self, v):
-        self.buf.write(struct.pack('<I', v & 0xFFFFFFFF))
+        self._put(_PACK_U32(v & 0xFFFFFFFF))
 
     def write_i32(self, v):
-        self.buf.write(struct.pack('<i', v))
+        self._put(_PACK_I32(v))
 
     def write_f32(self, v):
-        self.buf.write(struct.pack('<f', v))
+        self._put(_PACK_F32(v))
 
     def write_u64(self, v):
-        self.buf.write(struct.pack('<Q', v))
+        self._put(_PACK_U64(v))
 
     def write_delphi_string(self, s):
-        encoded = s.encode('ascii', errors='replace')
-        self.write_u32(len(encoded))
-        self.buf.write(encoded)
+        try:
+            encoded = s.encode('ascii')
+        except UnicodeEncodeError:
+            encoded = s.encode('ascii', errors='replace')
+        self._put(_PACK_U32(len(encoded)))
+        self._put(encoded)
 
     def get_bytes(self):
         return self.buf.getvalue()
@@ -289,6 +546,7 @@ class ParWriter:
 def write_par(par):
     """Write a ParFile to binary. Returns bytes."""
     w = ParWriter()
+    write_value = _field_writers(w)
 
     # Header
     w.write_bytes(PAR_MAGIC)
@@ -299,54 +557,46 @@ def write_par(par):
     w.write_u32(0)   # pad
 
     for pl in par.lists:
-        w.write_u32(pl.unknown1)
-        w.write_u32(pl.unknown2)
-
-        # Prefixed Array<List Entry>
-        w.write_u32(len(pl.entries))
+        # unknown1, unknown2, then Prefixed Array<List Entry> count
+        w.write_bytes(_LIST_HEADER.pack(pl.unknown1 & 0xFFFFFFFF,
+                                        pl.unknown2 & 0xFFFFFFFF,
+                                        len(pl.entries)))
 
         for entry in pl.entries:
             w.write_delphi_string(entry.name)
-            w.write_i8(entry.unknown_byte)
-
-            field_count = len(entry.fields)
-            w.write_u16(field_count)
-            w.write_u16(entry.unknown_u16a)
-            w.write_u16(entry.unknown_u16b)
+            w.write_bytes(_ENTRY_HEADER.pack(entry.unknown_byte,
+                                             entry.field_count & 0xFFFF,
+                                             entry.unknown_u16a & 0xFFFF,
+                                             entry.unknown_u16b & 0xFFFF))
+
+            if entry._raw is not None:
+                # Never decoded, so unchanged: copy type list + values through
+                data, type_pos, _count, end = entry._raw
+                w.write_bytes(data[type_pos:end])
+                continue
 
             # Data Type List
-            for field in entry.fields:
-                w.write_u8(field.dtype)
+            w.write_bytes(bytes([field.dtype & 0xFF for field in entry.fields]))
 
             # Data Entry List
             for field in entry.fields:
-                dtype = field.dtype
-                val = field.value
+                write = write_value.get(field.dtype)
+                if write is not None:
+                    write(field.value)
 
-                if dtype == TYPE_INT32:
-                    w.write_i32(int(val))
-                elif dtype == TYPE_FLOAT32:
-                    w.write_f32(float(val))
-                elif dtype == TYPE_UINT32:
-                    w.write_u32(int(val))
-                elif dtype == TYPE_STRING:
-                    w.write_delphi_string(str(val))
-                elif dtype == TYPE_ARRAY_INT32:
-                    _write_extra_array(w, val, 'i')
-                elif dtype == TYPE_ARRAY_FLOAT:
-                    _write_extra_array(w, val, 'f')
-                elif dtype == TYPE_ARRAY_UINT32:
-                    _write_extra_array(w, val, 'I')
-                elif dtype == TYPE_ARRAY_STR:
-                    _write_extra_string_array(w, val)
-
-    result = w.get_bytes()
-
-    # Append trailing data if present (for byte-perfect roundtrips)
-    if getattr(par, 'trailing_data', None):
-        result += par.trailing_data
+    # Append trailing data if present (for byte-perfect roundtrips).
+    # Written into the buffer so the finished output is not copied again.
+    if par.trailing_data:
+        w.write_bytes(par.trailing_data)
 
-    return result
+    return w.get_bytes()
+
+
+_ARRAY_COERCE = {
+    'i': int,
+    'f': float,
+    'I': lambda v: int(v) & 0xFFFFFFFF,
+}
 
 
 def _write_extra_array(writer, values, fmt_char):
@@ -356,13 +606,26 @@ def _write_extra_array(writer, values, fmt_char):
         return
     writer.write_u64(1)
     writer.write_u32(len(values))
-    for v in values:
-        if fmt_char == 'i':
-            writer.write_i32(int(v))
-        elif fmt_char == 'f':
-            writer.write_f32(float(v))
-        elif fmt_char == 'I':
-            writer.write_u32(int(v))
+    try:
+        arr = array.array(fmt_char, values)
+    except (TypeError, OverflowError):
+        # Edited/imported values may be strings, floats or out of range — coerce each
+        values = list(map(_ARRAY_COERCE[fmt_char], values))
+        arr = array.array(fmt_char, values)
+    if fmt_char == 'f':
+        _check_float32_range(arr, values)
+    if _BIG_ENDIAN:
+        arr.byteswap()
+    writer.write_bytes(arr.tobytes())
+
+
+def _check_float32_range(arr, values):
+    """Raise OverflowError, as struct.pack('<f') does, if a finite value in
+    values became inf in the float32 array arr (array.array('f') doesn't raise)."""
+    if math.inf in arr or -math.inf in arr:
+        for stored, value in zip(arr, values):
+            if math.isinf(stored) and not math.isinf(value):
+                raise OverflowError("float too large to pack with f format")
 
 
 def _write_extra_string_array(writer, values):
@@ -376,6 +639,20 @@ def _write_extra_string_array(writer, values):
         writer.write_delphi_string(str(v))
 
 
+def _field_writers(w):
+    """Jump table dtype -> callable(value) writing one field value to w."""
+    return {
+        TYPE_INT32:        lambda v: w.write_i32(int(v)),
+        TYPE_FLOAT32:      lambda v: w.write_f32(float(v)),
+        TYPE_UINT32:       lambda v: w.write_u32(int(v)),
+        TYPE_STRING:       lambda v: w.write_delphi_string(str(v)),
+        TYPE_ARRAY_INT32:  lambda v: _write_extra_array(w, v, 'i'),
+        TYPE_ARRAY_FLOAT:  lambda v: _write_extra_array(w, v, 'f'),
+        TYPE_ARRAY_UINT32: lambda v: _write_extra_array(w, v, 'I'),
+        TYPE_ARRAY_STR:    lambda v: _write_extra_string_array(w, v),
+    }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # ZLIB WRAPPER (TW1 .par files are double-zlib: wrapper stream + PAR stream)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -393,44 +670,99 @@ def decompress_par_file(raw_data):
     # Check for zlib header (0x78 = CMF byte for deflate)
     if len(raw_data) < 4 or raw_data[0] != 0x78:
         # Not compressed — check if it's raw PAR
+        # raw_data may be an mmap, which has no startswith()
         if raw_data[:4] == PAR_MAGIC:
             return raw_data, None, False
         raise ValueError(f"Unknown format (header: {raw_data[:4].hex()})")
 
     # Decompress stream 1 (wrapper)
-    dec1 = zlib.decompressobj()
+    dec1 = _zlib.decompressobj()
     wrapper = dec1.decompress(raw_data)
     remaining = dec1.unused_data
 
     if not remaining:
         # Single stream — check if it's PAR directly
-        if wrapper[:4] == PAR_MAGIC:
+        if wrapper.startswith(PAR_MAGIC):
             return wrapper, None, True
         raise ValueError(f"Single zlib stream but not PAR (header: {wrapper[:4].hex()})")
 
-    # Decompress stream 2 (PAR payload)
-    dec2 = zlib.decompressobj()
+    # Decompress stream 2 (PAR payload). This stays on the calling thread:
+    # its offset is only known once stream 1 is inflated, and read_par needs
+    # the complete payload, so a worker thread would have nothing to overlap.
+    dec2 = _zlib.decompressobj()
     par_data = dec2.decompress(remaining)
 
-    if par_data[:4] != PAR_MAGIC:
+    if not par_data.startswith(PAR_MAGIC):
         raise ValueError(f"Stream 2 is not PAR (header: {par_data[:4].hex()})")
 
     return par_data, wrapper, True
 
 
-def compress_par_file(par_data, wrapper=None):
+def compress_par_file(par_data, wrapper=None, level=3):
     """Compress PAR data back to .par file format.
     
     If wrapper is provided, creates dual-stream zlib (wrapper + PAR).
     Otherwise just compresses the PAR data as a single stream.
+    Level 3 is several times faster than zlib's default 6 for a few % in size.
     """
     if wrapper is not None:
-        # Dual-stream: compress wrapper, then compress PAR, concatenate
-        stream1 = zlib.compress(wrapper)
-        stream2 = zlib.compress(par_data)
+        # Dual-stream: compress wrapper, then compress PAR, concatenate.
+        # The wrapper is ~44 bytes, so compressing the two in parallel buys nothing.
+        stream1 = _zlib.compress(wrapper, level)
+        stream2 = _zlib.compress(par_data, level)
         return stream1 + stream2
     else:
-        return zlib.compress(par_data)
+        return _zlib.compress(par_data, level)
+
+
+def _par_digest(par_data, wrapper):
+    """Fingerprint of the uncompressed PAR payload plus wrapper."""
+    h = hashlib.blake2b(par_data, digest_size=16)
+    if wrapper:
+        h.update(wrapper)
+    return h.digest()
+
+
+def remember_compressed(par, par_data, compressed):
+    """Record the on-disk bytes matching par_data (after a load or save)."""
+    par.compressed_cache = (_par_digest(par_data, par.wrapper_header), compressed)
+
+
+def compress_par_cached(par, par_data):
+    """compress_par_file() for par, skipping zlib when par_data is unchanged
+    since the last load/save (e.g. open → inspect → save)."""
+    digest = _par_digest(par_data, par.wrapper_header)
+    cache = par.compressed_cache
+    if cache is not None and cache[0] == digest:
+        return cache[1]
+    compressed = compress_par_file(par_data, par.wrapper_header)
+    par.compressed_cache = (digest, compressed)
+    return compressed
+
+
+def read_par_file(path, lazy=False):
+    """Load a .par file from disk (compressed or raw). Returns ParFile.
+
+    The file is memory-mapped rather than read into a bytes copy; zlib and
+    ParReader both accept the mapping directly.
+    """
+    with open(path, 'rb') as f:
+        try:
+            raw_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raw_data = f.read()   # empty files can't be mapped
+    try:
+        par_data, wrapper, was_compressed = decompress_par_file(raw_data)
+        par = read_par(par_data, lazy)
+        par.filepath = path
+        par.wrapper_header = wrapper
+        par.was_compressed = was_compressed
+        if was_compressed:
+            remember_compressed(par, par_data, raw_data[:])
+    finally:
+        if isinstance(raw_data, mmap.mmap):
+            raw_data.close()
+    return par
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -439,56 +771,55 @@ def compress_par_file(par_data, wrapper=None):
 
 def par_to_dict(par, field_labels=None):
     """Convert ParFile to a serializable dict."""
-    result = OrderedDict()
-    result["_format"] = "TW1_PAR"
-    result["_version"] = par.version
+    result = {
+        "_format": "TW1_PAR",
+        "_version": par.version,
+    }
 
     lists = []
     for li, pl in enumerate(par.lists):
-        list_data = OrderedDict()
-        list_data["_index"] = li
-        list_data["_unknown1"] = pl.unknown1
-        list_data["_unknown2"] = pl.unknown2
-        list_data["_entry_count"] = len(pl.entries)
-
         entries = []
         for entry in pl.entries:
-            ed = OrderedDict()
-            ed["name"] = entry.name
-            ed["_unknown_byte"] = entry.unknown_byte
-            ed["_unknown_u16a"] = entry.unknown_u16a
-            ed["_unknown_u16b"] = entry.unknown_u16b
-
             fields = []
             field_count = len(entry.fields)
             for fi, field in enumerate(entry.fields):
-                fd = OrderedDict()
-                # Add label if available
+                dtype = field.dtype
+                fd = {
+                    "type": TYPE_NAMES.get(dtype) or f"unknown({dtype})",
+                    "type_id": dtype,
+                    "value": field.value,
+                }
+                # Add label if available (listed first)
                 if field_labels:
                     lbl = field_labels.get(field_count, fi)
                     if lbl:
-                        fd["label"] = lbl
-                fd["type"] = TYPE_NAMES.get(field.dtype, f"unknown({field.dtype})")
-                fd["type_id"] = field.dtype
-                fd["value"] = field.value
+                        fd = {"label": lbl, **fd}
                 fields.append(fd)
 
-            ed["fields"] = fields
-            entries.append(ed)
-
-        list_data["entries"] = entries
-        lists.append(list_data)
+            entries.append({
+                "name": entry.name,
+                "_unknown_byte": entry.unknown_byte,
+                "_unknown_u16a": entry.unknown_u16a,
+                "_unknown_u16b": entry.unknown_u16b,
+                "fields": fields,
+            })
+
+        lists.append({
+            "_index": li,
+            "_unknown1": pl.unknown1,
+            "_unknown2": pl.unknown2,
+            "_entry_count": len(pl.entries),
+            "entries": entries,
+        })
 
     result["lists"] = lists
 
     # Preserve trailing data for byte-perfect roundtrips
     if par.trailing_data:
-        import base64
         result["_trailing_data"] = base64.b64encode(par.trailing_data).decode('ascii')
 
     # Preserve wrapper header for compressed roundtrips
     if par.wrapper_header:
-        import base64
         result["_wrapper_header"] = base64.b64encode(par.wrapper_header).decode('ascii')
         result["_was_compressed"] = True
 
@@ -498,10 +829,43 @@ def par_to_dict(par, field_labels=None):
 def export_json(par, filepath, field_labels=None):
     """Export ParFile as JSON."""
     data = par_to_dict(par, field_labels)
+    # orjson writes NaN/Infinity as null, so it is only used when every
+    # float is finite; the stdlib encoder keeps them as NaN/Infinity.
+    if HAS_ORJSON and _floats_finite(par):
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 
+def _floats_finite(par):
+    """True if no float32 field or array element is NaN or infinite."""
+    isfinite = math.isfinite
+    try:
+        for pl in par.lists:
+            for entry in pl.entries:
+                for field in entry.fields:
+                    if field.dtype == TYPE_FLOAT32:
+                        if not isfinite(field.value):
+                            return False
+                    elif field.dtype == TYPE_ARRAY_FLOAT and field.value:
+                        if not all(map(isfinite, field.value)):
+                            return False
+    except TypeError:
+        return False   # e.g. None from import_json: leave it to the stdlib encoder
+    return True
+
+
+# Scalar dtype -> Python type for values read back from JSON
+_JSON_COERCE = {
+    TYPE_INT32:   int,
+    TYPE_UINT32:  int,
+    TYPE_FLOAT32: float,
+    TYPE_STRING:  str,
+}
+
+
 def import_json(filepath):
     """Import ParFile from JSON."""
     with open(filepath, 'r', encoding='utf-8') as f:
@@ -512,12 +876,10 @@ def import_json(filepath):
 
     # Restore trailing data if present
     if "_trailing_data" in data:
-        import base64
         par.trailing_data = base64.b64decode(data["_trailing_data"])
 
     # Restore wrapper header if present
     if "_wrapper_header" in data:
-        import base64
         par.wrapper_header = base64.b64decode(data["_wrapper_header"])
         par.was_compressed = data.get("_was_compressed", True)
 
@@ -534,22 +896,15 @@ def import_json(filepath):
             entry.unknown_u16b = ed.get("_unknown_u16b", 0)
 
             for fd in ed.get("fields", []):
-                field = ParField()
-                field.dtype = fd.get("type_id", 0)
-                field.value = fd.get("value")
-
-                # Ensure correct Python types
-                if field.dtype in (TYPE_INT32, TYPE_UINT32):
-                    if field.value is not None:
-                        field.value = int(field.value)
-                elif field.dtype == TYPE_FLOAT32:
-                    if field.value is not None:
-                        field.value = float(field.value)
-                elif field.dtype == TYPE_STRING:
-                    if field.value is not None:
-                        field.value = str(field.value)
-
-                entry.fields.append(field)
+                dtype = fd.get("type_id", 0)
+                value = fd.get("value")
+
+                # Ensure correct Python types (arrays pass through)
+                coerce = _JSON_COERCE.get(dtype)
+                if coerce is not None and value is not None:
+                    value = coerce(value)
+
+                entry.fields.append(ParField(dtype, value))
 
             pl.entries.append(entry)
         par.lists.append(pl)
@@ -593,17 +948,35 @@ def _find_sdk_labels_path():
     return None
 
 
+@functools.lru_cache(maxsize=4)
+def _read_labels_json(path, mtime_ns, size):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+    return {(int(fc), int(fi)): v
+            for fc, fields in data.items() for fi, v in fields.items()}
+
+
+def _load_labels_file(path):
+    """Load a labels/descriptions JSON file as {(field_count, field_idx): str}.
+    Cached per (path, mtime, size) so re-opening the editor doesn't re-parse;
+    callers merge it into their own dict rather than mutating it."""
+    st = os.stat(path)
+    return _read_labels_json(path, st.st_mtime_ns, st.st_size)
+
+
 class FieldLabels:
     """Manages field labels per field-count category.
     Loads SDK labels from tw1_sdk_labels.json, then user overrides on top."""
 
     def __init__(self, user_filepath=None):
-        self.labels = {}       # {field_count: {field_idx: "label"}}
+        self.labels = {}       # {(field_count, field_idx): "label"}
         self.user_filepath = user_filepath
 
         # 1. Minimal fallback defaults
         for fc, fields in DEFAULT_LABELS.items():
-            self.labels[fc] = dict(fields)
+            for fi, lbl in fields.items():
+                self.labels[fc, fi] = lbl
 
         # 2. Load SDK labels (from tw1_sdk_labels.json)
         sdk_path = _find_sdk_labels_path()
@@ -614,35 +987,27 @@ class FieldLabels:
         if user_filepath and os.path.isfile(user_filepath):
             self._load_json(user_filepath)
 
+    def __len__(self):
+        return len(self.labels)
+
     def get(self, field_count, field_idx):
         """Get label for a field, or None."""
-        fc_labels = self.labels.get(field_count, {})
-        return fc_labels.get(field_idx)
+        return self.labels.get((field_count, field_idx))
 
     def set(self, field_count, field_idx, label):
         """Set a user label (saved to user file)."""
-        if field_count not in self.labels:
-            self.labels[field_count] = {}
-        self.labels[field_count][field_idx] = label
+        self.labels[field_count, field_idx] = label
         self._save_user()
 
     def remove(self, field_count, field_idx):
         """Remove a label."""
-        if field_count in self.labels and field_idx in self.labels[field_count]:
-            del self.labels[field_count][field_idx]
+        if self.labels.pop((field_count, field_idx), None) is not None:
             self._save_user()
 
     def _load_json(self, filepath):
         """Load labels from a JSON file, merging into existing."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            for fc_str, fields in data.items():
-                fc = int(fc_str)
-                if fc not in self.labels:
-                    self.labels[fc] = {}
-                for fi_str, lbl in fields.items():
-                    self.labels[fc][int(fi_str)] = lbl
+            self.labels.update(_load_labels_file(filepath))
         except Exception:
             pass
 
@@ -651,8 +1016,8 @@ class FieldLabels:
         if not self.user_filepath:
             return
         data = {}
-        for fc, fields in self.labels.items():
-            data[str(fc)] = {str(fi): lbl for fi, lbl in fields.items()}
+        for (fc, fi), lbl in self.labels.items():
+            data.setdefault(str(fc), {})[str(fi)] = lbl
         try:
             with open(self.user_filepath, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
@@ -664,7 +1029,7 @@ class FieldDescriptions:
     """Loads German field descriptions from tw1_sdk_descriptions.json."""
 
     def __init__(self):
-        self.descs = {}  # {field_count: {field_idx: "description"}}
+        self.descs = {}  # {(field_count, field_idx): "description"}
         # Look for descriptions file next to script, home, cwd
         candidates = [
             os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tw1_sdk_descriptions.json'),
@@ -674,17 +1039,16 @@ class FieldDescriptions:
         for path in candidates:
             if os.path.isfile(path):
                 try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    for fc_str, fields in data.items():
-                        fc = int(fc_str)
-                        self.descs[fc] = {int(fi): d for fi, d in fields.items()}
+                    self.descs.update(_load_labels_file(path))
                 except Exception:
                     pass
                 break
 
+    def __len__(self):
+        return len(self.descs)
+
     def get(self, field_count, field_idx):
-        return self.descs.get(field_count, {}).get(field_idx)
+        return self.descs.get((field_count, field_idx))
 
 
 class ToolTip:
@@ -790,6 +1154,141 @@ class ListboxToolTip:
             self.tip_window = None
 
 
+class FieldRow:
+    """One field row of the detail panel. Rows are pooled by ParEditorApp and
+    reconfigured for each shown entry instead of being destroyed and rebuilt."""
+
+    # name_label styles for a labelled field / the clickable "···" placeholder
+    LABEL_STYLE = {'fg': '#4fc1e9', 'font': ('Consolas', 10, 'bold'), 'cursor': ''}
+    PLACEHOLDER_STYLE = {'text': "···", 'fg': '#444444', 'font': ('Consolas', 9),
+                         'cursor': 'hand2'}
+
+    def __init__(self, app, parent):
+        self.app = app
+        self.field_count = 0
+        self.field_idx = 0
+        self.has_label = None     # unknown until the first set_label
+        self.kind = None          # 'scalar' / 'array' value widget currently packed
+        self.arr_shown = False
+        self.pending_lines = None # array lines not yet inserted into arr_text
+        self.shown = False
+
+        self.frame = tk.Frame(parent, bg=app.BG2)
+        header_frame = tk.Frame(self.frame, bg=app.BG2)
+        header_frame.pack(fill='x')
+
+        self.idx_label = tk.Label(header_frame, bg=app.BG2, fg='#555555',
+                                  font=('Consolas', 9), width=5, anchor='e')
+        self.idx_label.pack(side='left')
+
+        self.name_label = tk.Label(header_frame, bg=app.BG2, anchor='w')
+        self.name_label.pack(side='left', padx=(4, 4))
+        # Tooltip with German description (text set per field)
+        self.tooltip = ToolTip(self.name_label)
+        # Left-click adds a label (placeholder only), right-click renames
+        self.name_label.bind('<Button-1>', self._on_name_click)
+        self.name_label.bind('<Button-3>', self._on_name_context)
+
+        self.type_label = tk.Label(header_frame, bg=app.BG2, fg=app.PURPLE,
+                                   font=('Consolas', 10), width=10, anchor='w')
+        self.type_label.pack(side='left', padx=(0, 8))
+
+        # Value widgets; only the one matching the field type is packed
+        self.var = tk.StringVar()
+        self.value_entry = tk.Entry(header_frame, textvariable=self.var,
+                                    bg=app.BG4, font=('Consolas', 10),
+                                    insertbackground=app.FG, relief='flat',
+                                    highlightthickness=1,
+                                    highlightcolor=app.ACCENT,
+                                    highlightbackground=app.BG3)
+        self.arr_label = tk.Label(header_frame, bg=app.BG2, fg=app.BLUE,
+                                  font=('Consolas', 10))
+
+        # Array contents below the header
+        self.arr_frame = tk.Frame(self.frame, bg=app.BG2)
+        self.arr_text = tk.Text(self.arr_frame, bg=app.BG4, fg=app.FG,
+                                font=('Consolas', 9), relief='flat',
+                                insertbackground=app.FG,
+                                highlightthickness=1,
+                                highlightcolor=app.ACCENT,
+                                highlightbackground=app.BG3,
+                                wrap='none')
+        self.arr_text.pack(fill='x', pady=1)
+
+        # Separator line
+        self.sep = tk.Frame(parent, bg=app.BG3, height=1)
+
+    def _on_name_click(self, event):
+        self.tooltip._hide()
+        if not self.has_label:
+            self.app._add_label(self.field_count, self.field_idx)
+
+    def _on_name_context(self, event):
+        self.tooltip._hide()
+        self.app._label_context(event, self.field_count, self.field_idx)
+
+    def show(self):
+        if not self.shown:
+            self.frame.pack(fill='x', padx=8, pady=2)
+            self.sep.pack(fill='x', padx=4, pady=1)
+            self.shown = True
+
+    def hide(self):
+        if self.shown:
+            self.tooltip._hide()
+            self.frame.pack_forget()
+            self.sep.pack_forget()
+            self.shown = False
+
+    def set_label(self, label_name, tip_text):
+        if label_name:
+            if self.has_label:
+                self.name_label.configure(text=label_name)
+            else:
+                self.name_label.configure(text=label_name, **self.LABEL_STYLE)
+            self.tooltip.update_text(f"{label_name}\n{tip_text}" if tip_text else '')
+        else:
+            # Clickable placeholder to add label
+            if self.has_label is not False:
+                self.name_label.configure(**self.PLACEHOLDER_STYLE)
+            self.tooltip.update_text('')
+        self.has_label = bool(label_name)
+
+    def set_kind(self, kind):
+        if kind == self.kind:
+            return
+        if self.kind == 'scalar':
+            self.value_entry.pack_forget()
+        elif self.kind == 'array':
+            self.arr_label.pack_forget()
+        if kind == 'scalar':
+            self.value_entry.pack(side='left', fill='x', expand=True, ipady=2)
+        elif kind == 'array':
+            self.arr_label.pack(side='left', padx=(0, 8))
+        self.kind = kind
+
+    def set_array_text(self, lines):
+        """Set the array Text to one value per line (hidden if empty).
+        The text is only inserted by fill_array, once the row is in view."""
+        self.pending_lines = None
+        self.arr_text.delete('1.0', 'end')
+        if not lines:
+            if self.arr_shown:
+                self.arr_frame.pack_forget()
+                self.arr_shown = False
+            return
+        self.arr_text.configure(height=min(len(lines), 8))
+        self.pending_lines = lines
+        if not self.arr_shown:
+            self.arr_frame.pack(fill='x', padx=(90, 0))
+            self.arr_shown = True
+
+    def fill_array(self):
+        if self.pending_lines is not None:
+            self.arr_text.insert('end', '\n'.join(self.pending_lines))
+            self.pending_lines = None
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # GUI
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -803,9 +1302,26 @@ class ParEditorApp:
 
         self.par = None           # Current ParFile
         self.filepath = ""        # Current file path
-        self.modified = False     # Unsaved changes flag
+        self._modified = False    # Unsaved changes flag (see .modified)
+        self._edits = 0           # Times .modified was set, see _finish_save
         self.search_results = []  # (list_idx, entry_idx) tuples
         self.search_idx = 0       # Current result index
+        self._search_index = None # [[lowercased searchable text per entry] per list]
+        self._last_query = None   # Query that produced search_results
+        self._last_results = None # Hits narrowing can start from (None = rescan)
+        self._tree_text = {}      # ParEntry -> tree row text (name + preview)
+        self._row_pool = []       # FieldRow widgets reused by _show_entry
+        self._fill_scheduled = False
+        self._region_scheduled = False
+        self._wheel_delta = 0
+        self._wheel_pending = False
+        self._tree_scroll_after = None  # pending _tree_scroll_idle, while scrolling
+        self._select_pending = False
+        # File loading/saving runs here so the Tk loop keeps repainting
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._io_future = None
+        self._io_done = None      # (done, status, error_msg) for _io_future
+        self._io_after = None     # pending _poll_io
 
         # Compare & Merge state
         self.cmp_source = None     # ParFile
@@ -824,6 +1340,18 @@ class ParEditorApp:
         self.field_descs = FieldDescriptions()
 
         self._setup_theme()
+        # dtype -> (value colour, row kind, value formatter) for _show_entry
+        fmt_float = '{:.6f}'.format
+        self._dtype_spec = {
+            TYPE_INT32:        (self.GREEN,  'scalar', str),
+            TYPE_UINT32:       (self.GREEN,  'scalar', str),
+            TYPE_FLOAT32:      (self.YELLOW, 'scalar', fmt_float),
+            TYPE_STRING:       (self.ORANGE, 'scalar', str),
+            TYPE_ARRAY_INT32:  (self.BLUE,   'array',  str),
+            TYPE_ARRAY_FLOAT:  (self.BLUE,   'array',  fmt_float),
+            TYPE_ARRAY_UINT32: (self.BLUE,   'array',  str),
+            TYPE_ARRAY_STR:    (self.BLUE,   'array',  str),
+        }
         self._build_ui()
         self._bind_keys()
 
@@ -979,11 +1507,13 @@ class ParEditorApp:
                                   selectmode='browse')
         tree_scroll = ttk.Scrollbar(tree_container, orient='vertical',
                                      command=self.tree.yview)
-        self.tree.configure(yscrollcommand=tree_scroll.set)
+        self.tree_scroll = tree_scroll
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
         self.tree.pack(side='left', fill='both', expand=True)
         tree_scroll.pack(side='right', fill='y')
 
         self.tree.bind('<<TreeviewSelect>>', self._on_tree_select)
+        self.tree.bind('<<TreeviewOpen>>', self._on_tree_open)
         self.tree.bind('<Button-3>', self._tree_context_menu)
 
         # Right: Detail Panel
@@ -1006,7 +1536,8 @@ class ParEditorApp:
                                         highlightthickness=0)
         detail_scroll = ttk.Scrollbar(detail_container, orient='vertical',
                                        command=self.detail_canvas.yview)
-        self.detail_canvas.configure(yscrollcommand=detail_scroll.set)
+        self.detail_scroll = detail_scroll
+        self.detail_canvas.configure(yscrollcommand=self._on_detail_scroll)
 
         self.detail_inner = tk.Frame(self.detail_canvas, bg=self.BG2)
         self.detail_canvas.create_window((0, 0), window=self.detail_inner,
@@ -1028,8 +1559,8 @@ class ParEditorApp:
         self.status = ttk.Label(self.root, text="Ready", style='Status.TLabel')
 
         # Show label info
-        total_labels = sum(len(v) for v in self.field_labels.labels.values())
-        total_descs = sum(len(v) for v in self.field_descs.descs.values())
+        total_labels = len(self.field_labels)
+        total_descs = len(self.field_descs)
         if total_labels > 100:
             desc_info = f", {total_descs} Beschreibungen" if total_descs > 0 else ""
             self.status.configure(text=f"Ready — {total_labels} SDK-Feldnamen{desc_info} geladen")
@@ -1047,12 +1578,22 @@ class ParEditorApp:
 
     def _bind_mousewheel(self, event):
         self.detail_canvas.bind_all('<MouseWheel>',
-                                     lambda e: self.detail_canvas.yview_scroll(
-                                         int(-1 * (e.delta / 120)), "units"))
-        self.detail_canvas.bind_all('<Button-4>',
-                                     lambda e: self.detail_canvas.yview_scroll(-3, "units"))
-        self.detail_canvas.bind_all('<Button-5>',
-                                     lambda e: self.detail_canvas.yview_scroll(3, "units"))
+                                     lambda e: self._queue_wheel(int(-1 * (e.delta / 120))))
+        self.detail_canvas.bind_all('<Button-4>', lambda e: self._queue_wheel(-3))
+        self.detail_canvas.bind_all('<Button-5>', lambda e: self._queue_wheel(3))
+
+    def _queue_wheel(self, units):
+        # Wheel ticks arriving in one burst are summed into a single scroll
+        self._wheel_delta += units
+        if not self._wheel_pending:
+            self._wheel_pending = True
+            self.root.after_idle(self._flush_wheel)
+
+    def _flush_wheel(self):
+        delta, self._wheel_delta = self._wheel_delta, 0
+        self._wheel_pending = False
+        if delta:
+            self.detail_canvas.yview_scroll(delta, "units")
 
     def _unbind_mousewheel(self, event):
         self.detail_canvas.unbind_all('<MouseWheel>')
@@ -1060,10 +1601,45 @@ class ParEditorApp:
         self.detail_canvas.unbind_all('<Button-5>')
 
     def _on_detail_configure(self, event):
+        # Rows resizing one after another (e.g. in _show_entry) share a
+        # single scrollregion update once the layout has settled.
+        if not self._region_scheduled:
+            self._region_scheduled = True
+            self.root.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        self._region_scheduled = False
         self.detail_canvas.configure(scrollregion=self.detail_canvas.bbox('all'))
+        self._schedule_fill_arrays()
 
     def _on_canvas_configure(self, event):
         self.detail_canvas.itemconfig('inner', width=event.width)
+        self._schedule_fill_arrays()
+
+    def _on_detail_scroll(self, first, last):
+        self.detail_scroll.set(first, last)
+        self._schedule_fill_arrays()
+
+    def _schedule_fill_arrays(self):
+        if not self._fill_scheduled:
+            self._fill_scheduled = True
+            self.root.after_idle(self._fill_visible_arrays)
+
+    def _fill_visible_arrays(self):
+        """Insert array contents for field rows that are scrolled into view."""
+        self._fill_scheduled = False
+        top = self.detail_canvas.canvasy(0)
+        bottom = top + self.detail_canvas.winfo_height()
+        for row in self._row_pool:
+            if not row.shown:
+                break       # shown rows are a prefix of the pool
+            if row.pending_lines is None:
+                continue
+            y = row.frame.winfo_y()
+            if y > bottom:
+                break
+            if y + row.frame.winfo_height() >= top:
+                row.fill_array()
 
     # ── File Operations ──
 
@@ -1076,16 +1652,63 @@ class ParEditorApp:
             return
         self._load_par(path)
 
+    def _run_io(self, work, done, status, error_msg):
+        """Run work() on the I/O thread, then done(result) on the Tk thread.
+        Errors are shown as "<error_msg>\n<exception>"."""
+        self._set_status(status)
+        self.root.configure(cursor='watch')
+        self._io_future = self._io_pool.submit(work)
+        self._io_done = (done, status, error_msg)
+        self._poll_io()
+
+    def _poll_io(self):
+        # Tk is not thread-safe: the worker never touches widgets, the
+        # result is picked up here by polling from the Tk loop.
+        self._io_after = None
+        if self._io_future.done():
+            self._finish_io()
+        else:
+            self._io_after = self.root.after(30, self._poll_io)
+
+    def _finish_io(self):
+        """Hand the pending I/O result to its done() callback, waiting for
+        the worker if it is still busy. Returns False if the work failed."""
+        fut = self._io_future
+        done, _status, error_msg = self._io_done
+        self._io_future = self._io_done = None
+        if self._io_after is not None:
+            self.root.after_cancel(self._io_after)
+            self._io_after = None
+        self.root.configure(cursor='')
+        try:
+            result = fut.result()
+        except Exception as e:
+            self._set_status("Ready")
+            messagebox.showerror("Error", f"{error_msg}\n{e}")
+            return False
+        done(result)
+        return True
+
+    def _io_busy(self):
+        """True (after telling the user) if an open/save is still running."""
+        if self._io_future is None:
+            return False
+        messagebox.showinfo("Busy", f"{self._io_done[1]}\n\n"
+                                    "Please try again when it has finished.")
+        return True
+
     def _load_par(self, path):
+        if self._io_busy():
+            return
+        self._run_io(lambda: read_par_file(path, lazy=True),
+                     lambda par: self._finish_load(par, path),
+                     f"Opening {Path(path).name}...", "Failed to open:")
+
+    def _finish_load(self, par, path):
         try:
-            with open(path, 'rb') as f:
-                raw_data = f.read()
-
-            par_data, wrapper, was_compressed = decompress_par_file(raw_data)
-            self.par = read_par(par_data)
-            self.par.filepath = path
-            self.par.wrapper_header = wrapper
-            self.par.was_compressed = was_compressed
+            self.par = par
+            self._tree_text.clear()
+            was_compressed = self.par.was_compressed
             self.filepath = path
             self.modified = False
             self._populate_tree()
@@ -1112,6 +1735,7 @@ class ParEditorApp:
             return
         try:
             self.par = import_json(path)
+            self._tree_text.clear()
             self.filepath = path.replace('.json', '.par')
             self.par.filepath = self.filepath
             self.modified = True
@@ -1148,26 +1772,43 @@ class ParEditorApp:
         self._do_save(path)
 
     def _do_save(self, path):
+        if self._io_busy():
+            return
         try:
             self._apply_current_edits()
             par_data = write_par(self.par)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save:\n{e}")
+            return
+
+        par = self.par
 
+        def work():
             # Re-compress if the original was compressed
-            if self.par.was_compressed:
-                out_data = compress_par_file(par_data, self.par.wrapper_header)
+            if par.was_compressed:
+                out_data = compress_par_cached(par, par_data)
             else:
                 out_data = par_data
 
             with open(path, 'wb') as f:
                 f.write(out_data)
-            self.filepath = path
-            self.par.filepath = path
+            return len(out_data)
+
+        edits = self._edits
+        self._run_io(work, lambda size: self._finish_save(par, path, size, edits),
+                     f"Saving {Path(path).name}...", "Failed to save:")
+
+    def _finish_save(self, par, path, size, edits):
+        if par is not self.par:
+            return   # another file was opened while saving
+        self.filepath = path
+        self.par.filepath = path
+        # Edits applied while the file was being written are not in it
+        if self._edits == edits:
             self.modified = False
-            self._update_title()
-            comp_str = " (zlib)" if self.par.was_compressed else ""
-            self._set_status(f"Saved {Path(path).name} ({len(out_data)} bytes{comp_str})")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save:\n{e}")
+        self._update_title()
+        comp_str = " (zlib)" if self.par.was_compressed else ""
+        self._set_status(f"Saved {Path(path).name} ({size} bytes{comp_str})")
 
     def _export_json(self):
         if not self.par:
@@ -1190,6 +1831,10 @@ class ParEditorApp:
             messagebox.showerror("Error", f"Failed to export:\n{e}")
 
     def _on_close(self):
+        # Finish a pending open/save first: whether it succeeded decides
+        # if there is anything left to save
+        if self._io_future is not None:
+            self._finish_io()
         if self.modified:
             r = messagebox.askyesnocancel("Unsaved Changes",
                                            "Save changes before closing?")
@@ -1197,8 +1842,24 @@ class ParEditorApp:
                 return
             if r:
                 self._save()
+                # Stay open if the save fails, the changes would be lost
+                if self._io_future is not None and not self._finish_io():
+                    return
+        self._io_pool.shutdown()
         self.root.destroy()
 
+    @property
+    def modified(self):
+        return self._modified
+
+    @modified.setter
+    def modified(self, value):
+        # Counting edits lets a background save tell whether the model
+        # changed after write_par took its snapshot
+        if value:
+            self._edits += 1
+        self._modified = value
+
     def _update_title(self):
         name = Path(self.filepath).name if self.filepath else "Untitled"
         mod = " *" if self.modified else ""
@@ -1212,6 +1873,10 @@ class ParEditorApp:
     def _populate_tree(self):
         self.tree.delete(*self.tree.get_children())
         self._clear_detail()
+        # Entries may have moved: rebuild the search index on next search
+        self._search_index = None
+        self._last_query = None
+        self._last_results = None
 
         if not self.par:
             return
@@ -1230,31 +1895,66 @@ class ParEditorApp:
             list_id = self.tree.insert('', 'end', iid=f"L{li}",
                                         text=f"  {list_label}",
                                         open=False)
-
-            # Entry nodes
-            for ei, entry in enumerate(pl.entries):
-                field_count = len(entry.fields)
-                # Find best preview: prefer first string field, else first value
-                preview = ""
-                for f in entry.fields[:5]:
-                    if f.dtype == TYPE_STRING and f.value:
-                        s = str(f.value)
-                        if len(s) > 35:
-                            s = s[-32:] 
-                            preview = f"...{s}"
-                        else:
-                            preview = s
-                        break
-                if not preview and field_count > 0:
-                    preview = self._field_preview(entry.fields[0])
-
-                entry_text = f"  {entry.name}"
-                if preview:
-                    entry_text = f"  {entry.name}  \u2502 {preview}"
-
-                self.tree.insert(list_id, 'end',
-                                  iid=f"L{li}E{ei}",
-                                  text=entry_text)
+            # Entry nodes are inserted when the list is first opened;
+            # a placeholder child keeps the expand arrow visible.
+            if entry_count:
+                self.tree.insert(list_id, 'end', iid=f"L{li}_stub", text="")
+
+    def _on_tree_open(self, event):
+        item_id = self.tree.focus()
+        if item_id.startswith('L') and 'E' not in item_id:
+            self._fill_list_node(int(item_id[1:]))
+
+    def _fill_list_node(self, li):
+        """Insert the entry nodes of list li, if not done yet."""
+        stub_id = f"L{li}_stub"
+        if not self.tree.exists(stub_id):
+            return
+        self.tree.delete(stub_id)
+        list_id = f"L{li}"
+
+        # Fill the list node while it is detached, so the inserts don't
+        # each invalidate the visible tree; reattach it at its old index.
+        focus = self.tree.focus()
+        selected = self.tree.selection()
+        self.tree.detach(list_id)
+        insert = self.tree.insert
+        tree_text = self._tree_text
+
+        for ei, entry in enumerate(self.par.lists[li].entries):
+            text = tree_text.get(entry)
+            if text is None:
+                text = tree_text[entry] = self._entry_tree_text(entry)
+            insert(list_id, 'end', iid=f"L{li}E{ei}", text=text)
+
+        self.tree.move(list_id, '', li)
+        if focus:
+            self.tree.focus(focus)
+        if selected and self.tree.selection() != selected:
+            self.tree.selection_set(selected)
+
+    def _entry_tree_text(self, entry):
+        """Tree row text: entry name plus a short value preview."""
+        preview = self._entry_preview(entry)
+        if preview:
+            return f"  {entry.name}  \u2502 {preview}"
+        return f"  {entry.name}"
+
+    def _entry_preview(self, entry):
+        """Preview text shown next to an entry name in the tree."""
+        # Only the first few fields are needed (keeps lazy entries lazy)
+        head = entry.head_fields(5)
+        # Find best preview: prefer first string field, else first value
+        for f in head:
+            if f.dtype == TYPE_STRING and f.value:
+                s = str(f.value)
+                if len(s) > 35:
+                    s = s[-32:] 
+                    return f"...{s}"
+                return s
+        if head:
+            return self._field_preview(head[0])
+        return ""
 
     def _field_preview(self, field):
         """Short preview string for a field value."""
@@ -1274,7 +1974,24 @@ class ParEditorApp:
 
     # ── Tree Selection → Detail ──
 
+    def _on_tree_scroll(self, first, last):
+        self.tree_scroll.set(first, last)
+        if self._tree_scroll_after is not None:
+            self.root.after_cancel(self._tree_scroll_after)
+        self._tree_scroll_after = self.root.after(120, self._tree_scroll_idle)
+
+    def _tree_scroll_idle(self):
+        self._tree_scroll_after = None
+        if self._select_pending:
+            self._select_pending = False
+            self._on_tree_select(None)
+
     def _on_tree_select(self, event):
+        # While the tree is scrolling (e.g. arrow key held down) only the
+        # last selection is shown, once scrolling has settled.
+        if self._tree_scroll_after is not None:
+            self._select_pending = True
+            return
         sel = self.tree.selection()
         if not sel:
             return
@@ -1287,6 +2004,10 @@ class ParEditorApp:
             parts = item_id[1:].split('E')
             li = int(parts[0])
             ei = int(parts[1])
+            # <<TreeviewSelect>> can repeat for the entry already shown
+            if (self.current_entry is not None and
+                    (li, ei) == (self.current_li, self.current_ei)):
+                return
             self._apply_current_edits()
             self._show_entry(li, ei)
         elif item_id.startswith('L'):
@@ -1315,15 +2036,14 @@ class ParEditorApp:
 
     def _show_entry(self, li, ei):
         """Show entry details in the right panel with editable fields."""
-        self._clear_detail()
-
-        if not self.par or li >= len(self.par.lists):
-            return
-        pl = self.par.lists[li]
-        if ei >= len(pl.entries):
+        if (not self.par or li >= len(self.par.lists)
+                or ei >= len(self.par.lists[li].entries)):
+            self._clear_detail()
             return
 
-        entry = pl.entries[ei]
+        entry = self.par.lists[li].entries[ei]
+        # Rows for this entry's fields are reconfigured below, not hidden
+        self._clear_detail(keep_rows=len(entry.fields))
         self.current_entry = entry
         self.current_li = li
         self.current_ei = ei
@@ -1337,124 +2057,62 @@ class ParEditorApp:
                  f"byte=0x{entry.unknown_byte & 0xFF:02X}  "
                  f"u16a={entry.unknown_u16a}  u16b={entry.unknown_u16b}")
 
-        parent = self.detail_inner
-
+        pool = self._row_pool
+        dtype_spec = self._dtype_spec
         for fi, field in enumerate(entry.fields):
-            row = tk.Frame(parent, bg=self.BG2)
-            row.pack(fill='x', padx=8, pady=2)
-
-            # Field index, label, and type
-            type_name = TYPE_NAMES.get(field.dtype, f"?{field.dtype}")
-            label_name = self.field_labels.get(field_count, fi)
-
-            header_frame = tk.Frame(row, bg=self.BG2)
-            header_frame.pack(fill='x')
-
-            idx_label = tk.Label(header_frame, text=f"[{fi}]",
-                                  bg=self.BG2, fg='#555555',
-                                  font=('Consolas', 9), width=5, anchor='e')
-            idx_label.pack(side='left')
-
-            # Show label if available
-            if label_name:
-                name_label = tk.Label(header_frame, text=label_name,
-                                       bg=self.BG2, fg='#4fc1e9',
-                                       font=('Consolas', 10, 'bold'),
-                                       anchor='w')
-                name_label.pack(side='left', padx=(4, 4))
-                # Right-click to rename
-                name_label.bind('<Button-3>',
-                    lambda e, fc=field_count, fidx=fi: self._label_context(e, fc, fidx))
-                # Tooltip with German description
-                tip_text = self.field_descs.get(field_count, fi)
-                if tip_text:
-                    ToolTip(name_label, f"{label_name}\n{tip_text}")
+            if fi < len(pool):
+                row = pool[fi]
             else:
-                # Clickable placeholder to add label
-                name_label = tk.Label(header_frame, text="···",
-                                       bg=self.BG2, fg='#444444',
-                                       font=('Consolas', 9),
-                                       cursor='hand2', anchor='w')
-                name_label.pack(side='left', padx=(4, 4))
-                name_label.bind('<Button-1>',
-                    lambda e, fc=field_count, fidx=fi: self._add_label(fc, fidx))
-                name_label.bind('<Button-3>',
-                    lambda e, fc=field_count, fidx=fi: self._label_context(e, fc, fidx))
-
-            type_label = tk.Label(header_frame, text=type_name,
-                                   bg=self.BG2, fg=self.PURPLE,
-                                   font=('Consolas', 10), width=10, anchor='w')
-            type_label.pack(side='left', padx=(0, 8))
+                row = FieldRow(self, self.detail_inner)
+                # Pool slot fi always shows field fi
+                row.idx_label.configure(text=f"[{fi}]")
+                pool.append(row)
+            row.field_count = field_count
+            row.field_idx = fi
+
+            # Field label and type
+            self._show_row_label(row)
+            row.type_label.configure(
+                text=TYPE_NAMES.get(field.dtype, f"?{field.dtype}"))
 
             # Value widget
-            if field.dtype in (TYPE_INT32, TYPE_UINT32):
-                var = tk.StringVar(value=str(field.value))
-                w = tk.Entry(header_frame, textvariable=var, bg=self.BG4,
-                             fg=self.GREEN, font=('Consolas', 10),
-                             insertbackground=self.FG, relief='flat',
-                             highlightthickness=1,
-                             highlightcolor=self.ACCENT,
-                             highlightbackground=self.BG3)
-                w.pack(side='left', fill='x', expand=True, ipady=2)
-                self.edit_widgets.append((fi, field.dtype, var))
-
-            elif field.dtype == TYPE_FLOAT32:
-                var = tk.StringVar(value=f"{field.value:.6f}")
-                w = tk.Entry(header_frame, textvariable=var, bg=self.BG4,
-                             fg=self.YELLOW, font=('Consolas', 10),
-                             insertbackground=self.FG, relief='flat',
-                             highlightthickness=1,
-                             highlightcolor=self.ACCENT,
-                             highlightbackground=self.BG3)
-                w.pack(side='left', fill='x', expand=True, ipady=2)
-                self.edit_widgets.append((fi, field.dtype, var))
-
-            elif field.dtype == TYPE_STRING:
-                var = tk.StringVar(value=str(field.value))
-                w = tk.Entry(header_frame, textvariable=var, bg=self.BG4,
-                             fg=self.ORANGE, font=('Consolas', 10),
-                             insertbackground=self.FG, relief='flat',
-                             highlightthickness=1,
-                             highlightcolor=self.ACCENT,
-                             highlightbackground=self.BG3)
-                w.pack(side='left', fill='x', expand=True, ipady=2)
-                self.edit_widgets.append((fi, field.dtype, var))
-
-            elif field.dtype in (TYPE_ARRAY_INT32, TYPE_ARRAY_FLOAT,
-                                  TYPE_ARRAY_UINT32, TYPE_ARRAY_STR):
+            fg, kind, fmt = dtype_spec.get(field.dtype, (None, None, None))
+            row.set_kind(kind)
+            if kind == 'scalar':
+                row.var.set(fmt(field.value))
+                row.value_entry.configure(fg=fg)
+                row.set_array_text(None)
+                self.edit_widgets.append((fi, field.dtype, row.var))
+
+            elif kind == 'array':
                 arr = field.value if field.value else []
-                arr_label = tk.Label(
-                    header_frame,
-                    text=f"[{len(arr)} items]",
-                    bg=self.BG2, fg=self.BLUE,
-                    font=('Consolas', 10))
-                arr_label.pack(side='left', padx=(0, 8))
-
+                row.arr_label.configure(text=f"[{len(arr)} items]")
                 # Show array contents below
+                row.set_array_text(list(map(fmt, arr)))
                 if arr:
-                    arr_frame = tk.Frame(row, bg=self.BG2)
-                    arr_frame.pack(fill='x', padx=(90, 0))
-
-                    arr_text = tk.Text(arr_frame, bg=self.BG4, fg=self.FG,
-                                        font=('Consolas', 9), relief='flat',
-                                        height=min(len(arr), 8),
-                                        insertbackground=self.FG,
-                                        highlightthickness=1,
-                                        highlightcolor=self.ACCENT,
-                                        highlightbackground=self.BG3,
-                                        wrap='none')
-                    for ai, av in enumerate(arr):
-                        if field.dtype == TYPE_ARRAY_FLOAT:
-                            line = f"{av:.6f}"
-                        else:
-                            line = str(av)
-                        arr_text.insert('end', line + ('\n' if ai < len(arr)-1 else ''))
-                    arr_text.pack(fill='x', pady=1)
-                    self.edit_widgets.append((fi, field.dtype, arr_text))
+                    self.edit_widgets.append((fi, field.dtype, row.arr_text))
+
+            else:
+                row.set_array_text(None)
+
+            row.show()
+
+        self._schedule_fill_arrays()
 
-            # Separator line
-            sep = tk.Frame(parent, bg=self.BG3, height=1)
-            sep.pack(fill='x', padx=4, pady=1)
+    def _show_row_label(self, row):
+        label_name = self.field_labels.get(row.field_count, row.field_idx)
+        row.set_label(label_name,
+                      self.field_descs.get(row.field_count, row.field_idx)
+                      if label_name else None)
+
+    def _refresh_field_label(self, field_count, field_idx):
+        """Relabel the shown row for a field after a label edit. Only that
+        row changes, so the entry is not re-rendered (and values being typed
+        into other rows are kept)."""
+        if (self.current_entry is not None
+                and self.current_entry.field_count == field_count
+                and field_idx < field_count):
+            self._show_row_label(self._row_pool[field_idx])
 
     def _label_context(self, event, field_count, field_idx):
         """Show right-click context menu for field labels."""
@@ -1485,9 +2143,7 @@ class ParEditorApp:
             self.field_labels.set(field_count, field_idx, name.strip())
             self._set_status(f"Label [{field_idx}] = '{name.strip()}' "
                             f"(for all {field_count}-field entries)")
-            # Refresh display
-            if self.current_entry:
-                self._show_entry(self.current_li, self.current_ei)
+            self._refresh_field_label(field_count, field_idx)
 
     def _rename_label(self, field_count, field_idx, current):
         """Rename an existing label."""
@@ -1499,15 +2155,13 @@ class ParEditorApp:
         if name and name.strip():
             self.field_labels.set(field_count, field_idx, name.strip())
             self._set_status(f"Renamed [{field_idx}] → '{name.strip()}'")
-            if self.current_entry:
-                self._show_entry(self.current_li, self.current_ei)
+            self._refresh_field_label(field_count, field_idx)
 
     def _remove_label(self, field_count, field_idx):
         """Remove a label."""
         self.field_labels.remove(field_count, field_idx)
         self._set_status(f"Removed label for [{field_idx}]")
-        if self.current_entry:
-            self._show_entry(self.current_li, self.current_ei)
+        self._refresh_field_label(field_count, field_idx)
 
     # ── Tree Context Menu (Right-Click) ──
 
@@ -1623,6 +2277,7 @@ class ParEditorApp:
         # Select the new entry
         new_item_id = f"L{li}E{ei + 1}"
         parent_id = f"L{li}"
+        self._fill_list_node(li)
         self.tree.item(parent_id, open=True)
         self.tree.selection_set(new_item_id)
         self.tree.see(new_item_id)
@@ -1657,6 +2312,7 @@ class ParEditorApp:
                     idx = f.value.lower().find(old_lower)
                     f.value = f.value[:idx] + new_name + f.value[idx + len(old_lower):]
                     updated_fields += 1
+        self._tree_text.pop(entry, None)
 
         self.modified = True
         self._update_title()
@@ -1665,6 +2321,7 @@ class ParEditorApp:
         # Reselect
         item_id = f"L{li}E{ei}"
         parent_id = f"L{li}"
+        self._fill_list_node(li)
         self.tree.item(parent_id, open=True)
         self.tree.selection_set(item_id)
         self.tree.see(item_id)
@@ -1740,6 +2397,7 @@ class ParEditorApp:
         new_ei = len(pl.entries) - 1
         item_id = f"L{li}E{new_ei}"
         parent_id = f"L{li}"
+        self._fill_list_node(li)
         self.tree.item(parent_id, open=True)
         self.tree.selection_set(item_id)
         self.tree.see(item_id)
@@ -1757,10 +2415,11 @@ class ParEditorApp:
             return f"{prefix}{num + 1:0{width}d}"
         return name + "_COPY"
 
-    def _clear_detail(self):
+    def _clear_detail(self, keep_rows=0):
         """Clear the detail panel."""
-        for w in self.detail_inner.winfo_children():
-            w.destroy()
+        # Field rows are only hidden; _show_entry reuses them
+        for row in self._row_pool[keep_rows:]:
+            row.hide()
         self.detail_header.configure(text="Select an entry")
         self.detail_info.configure(text="")
         self.edit_widgets = []
@@ -1777,17 +2436,24 @@ class ParEditorApp:
         for fi, dtype, widget in self.edit_widgets:
             if fi >= len(entry.fields):
                 continue
+            if self._row_pool[fi].pending_lines is not None:
+                continue   # array never scrolled into view, so not edited
             field = entry.fields[fi]
 
             try:
                 if dtype in (TYPE_INT32, TYPE_UINT32):
                     new_val = int(widget.get())
+                    if dtype == TYPE_INT32:
+                        # Reject values write_par couldn't pack (struct.error);
+                        # uint32 needs no check, the writer masks it to 32 bits
+                        _PACK_I32(new_val)
                     if new_val != field.value:
                         field.value = new_val
                         changed = True
 
                 elif dtype == TYPE_FLOAT32:
                     new_val = float(widget.get())
+                    _PACK_F32(new_val)   # OverflowError beyond float32 range
                     if new_val != field.value:
                         field.value = new_val
                         changed = True
@@ -1803,16 +2469,21 @@ class ParEditorApp:
                     # widget is a Text widget
                     text = widget.get('1.0', 'end').strip()
                     if text:
-                        lines = [l.strip() for l in text.split('\n')
-                                 if l.strip()]
+                        # Non-blank lines; int()/float() ignore the
+                        # surrounding whitespace, so numbers skip strip()
+                        lines = list(filter(str.strip, text.split('\n')))
                         if dtype == TYPE_ARRAY_INT32:
-                            new_val = [int(l) for l in lines]
+                            new_val = list(map(int, lines))
+                            array.array('i', new_val)   # range check
                         elif dtype == TYPE_ARRAY_FLOAT:
-                            new_val = [float(l) for l in lines]
+                            new_val = list(map(float, lines))
+                            _check_float32_range(array.array('f', new_val),
+                                                 new_val)
                         elif dtype == TYPE_ARRAY_UINT32:
-                            new_val = [int(l) for l in lines]
+                            # Not range-checked: the writer masks to 32 bits
+                            new_val = list(map(int, lines))
                         elif dtype == TYPE_ARRAY_STR:
-                            new_val = lines
+                            new_val = [l.strip() for l in lines]
                         else:
                             new_val = field.value
                     else:
@@ -1822,10 +2493,16 @@ class ParEditorApp:
                         field.value = new_val
                         changed = True
 
-            except (ValueError, TypeError):
-                pass   # Keep old value on invalid input
+            except (ValueError, TypeError, OverflowError, struct.error):
+                pass   # Keep old value on invalid or out-of-range input
 
         if changed:
+            self._tree_text.pop(entry, None)
+            if self._search_index is not None:
+                self._search_index[self.current_li][self.current_ei] = \
+                    self._search_text(entry)
+                # The edit may add a hit the previous results never saw
+                self._last_results = None
             self.modified = True
             self._update_title()
 
@@ -1838,23 +2515,25 @@ class ParEditorApp:
             return
 
         # Build results list on first search or query change
-        if (not hasattr(self, '_last_query') or
-                self._last_query != query):
-            self._last_query = query
-            self.search_results = []
+        if self._last_query != query:
             self.search_idx = 0
-
-            for li, pl in enumerate(self.par.lists):
-                for ei, entry in enumerate(pl.entries):
-                    if query in entry.name.lower():
-                        self.search_results.append((li, ei))
-                    else:
-                        # Search in string field values too
-                        for field in entry.fields:
-                            if field.dtype == TYPE_STRING:
-                                if query in str(field.value).lower():
-                                    self.search_results.append((li, ei))
-                                    break
+            if self._search_index is None:
+                self._search_index = [[self._search_text(entry)
+                                       for entry in pl.entries]
+                                      for pl in self.par.lists]
+            index = self._search_index
+            if (self._last_results is not None and
+                    query.startswith(self._last_query)):
+                # Typing on: every hit must already be among the previous hits
+                self.search_results = [(li, ei) for li, ei in self._last_results
+                                       if query in index[li][ei]]
+            else:
+                self.search_results = [(li, ei)
+                                       for li, texts in enumerate(index)
+                                       for ei, text in enumerate(texts)
+                                       if query in text]
+            self._last_query = query
+            self._last_results = self.search_results
 
         if not self.search_results:
             self.search_label.configure(text="No results")
@@ -1874,11 +2553,20 @@ class ParEditorApp:
         item_id = f"L{li}E{ei}"
         parent_id = f"L{li}"
 
+        self._fill_list_node(li)
         self.tree.item(parent_id, open=True)
         self.tree.selection_set(item_id)
         self.tree.see(item_id)
         self.tree.focus(item_id)
 
+    @staticmethod
+    def _search_text(entry):
+        """Entry name and string field values, lowercased, for substring search."""
+        parts = [entry.name]
+        parts += [str(f.value) for f in entry.fields if f.dtype == TYPE_STRING]
+        # \x1f (unit separator) can't be typed, so matches never span parts
+        return '\x1f'.join(parts).lower()
+
     # ══════════════════════════════════════════════════════════════════════
     # COMPARE & MERGE TAB
     # ══════════════════════════════════════════════════════════════════════
@@ -2046,13 +2734,7 @@ class ParEditorApp:
         if not path:
             return None, ''
         try:
-            with open(path, 'rb') as f:
-                raw = f.read()
-            par_data, wrapper, was_compressed = decompress_par_file(raw)
-            par = read_par(par_data)
-            par.filepath = path
-            par.wrapper_header = wrapper
-            par.was_compressed = was_compressed
+            par = read_par_file(path)
             return par, path
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load PAR:\n{e}")
@@ -2093,11 +2775,7 @@ class ParEditorApp:
         """Auto-load original PAR from saved config path."""
         if self._cmp_original_path and os.path.isfile(self._cmp_original_path):
             try:
-                with open(self._cmp_original_path, 'rb') as f:
-                    raw = f.read()
-                par_data, wrapper, was_compressed = decompress_par_file(raw)
-                self.cmp_original = read_par(par_data)
-                self.cmp_original.filepath = self._cmp_original_path
+                self.cmp_original = read_par_file(self._cmp_original_path)
                 self.cmp_original_label.configure(
                     text=Path(self._cmp_original_path).name, fg=self.FG)
             except:
@@ -2502,7 +3180,7 @@ class ParEditorApp:
         try:
             par_data = write_par(self.cmp_source)
             if self.cmp_source.was_compressed:
-                output = compress_par_file(par_data, self.cmp_source.wrapper_header)
+                output = compress_par_cached(self.cmp_source, par_data)
             else:
                 output = par_data
             with open(path, 'wb') as f:
@@ -2541,7 +3219,7 @@ def cli_info(path):
         raw_data = f.read()
 
     par_data, wrapper, was_compressed = decompress_par_file(raw_data)
-    par = read_par(par_data)
+    par = read_par(par_data, lazy=True)   # only names and type lists are shown
     total = sum(len(pl.entries) for pl in par.lists)
     print(f"PAR File: {path}")
     if was_compressed:
@@ -2553,13 +3231,18 @@ def cli_info(path):
     print(f"Entries:  {total}")
     print()
 
+    write = sys.stdout.write
+    sig_text = {}   # type list bytes -> "int32, float32, ..."
     for li, pl in enumerate(par.lists):
-        print(f"  List {li}: {len(pl.entries)} entries "
-              f"(unk1=0x{pl.unknown1:X}, unk2=0x{pl.unknown2:X})")
+        write(f"  List {li}: {len(pl.entries)} entries "
+              f"(unk1=0x{pl.unknown1:X}, unk2=0x{pl.unknown2:X})\n")
         for ei, entry in enumerate(pl.entries):
-            fields_str = ", ".join(
-                TYPE_NAMES.get(f.dtype, '?') for f in entry.fields)
-            print(f"    [{ei}] {entry.name}  ({fields_str})")
+            sig = entry.dtypes
+            fields_str = sig_text.get(sig)
+            if fields_str is None:
+                fields_str = sig_text[sig] = ", ".join(
+                    TYPE_NAMES.get(d, '?') for d in sig)
+            write(f"    [{ei}] {entry.name}  ({fields_str})\n")
 
 
 def cli_export(par_path, json_path):
@@ -2593,7 +3276,7 @@ if __name__ == '__main__':
             print("Export: python tw1_par_editor.py --export file.par output.json")
         else:
             # Try to open as file in GUI
-            if HAS_TK:
+            if _import_tk():
                 root = tk.Tk()
                 app = ParEditorApp(root)
                 if os.path.isfile(cmd):
@@ -2602,7 +3285,7 @@ if __name__ == '__main__':
             else:
                 print("Usage: python tw1_par_editor.py [--info|--export] file.par")
     else:
-        if not HAS_TK:
+        if not _import_tk():
             print("Usage: python tw1_par_editor.py [--info|--export|--help] file.par")
             print("       or run without args for GUI (requires tkinter)")
             sys.exit(1)